@@ -199,7 +199,7 @@ class ArrayNodeMapTask(PythonTask):
         """
         TODO ADD bound variables to the resolver. Maybe we need a different resolver?
         """
-        mt = ArrayNodeMapTaskResolver()
+        mt = array_node_map_task_resolver
         container_args = [
             "pyflyte-map-execute",
             "--inputs",
@@ -474,3 +474,6 @@ class ArrayNodeMapTaskResolver(tracker.TrackedInstance, TaskResolverMixin):
 
     def get_all_tasks(self) -> List[Task]:
         raise NotImplementedError("MapTask resolver cannot return every instance of the map task")
+
+
+array_node_map_task_resolver = ArrayNodeMapTaskResolver()
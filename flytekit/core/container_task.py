@@ -1,7 +1,8 @@
 import os
+import re
 import typing
 from enum import Enum
-from typing import Any, Dict, List, Optional, OrderedDict, Tuple, Type
+from typing import Any, Dict, List, Optional, OrderedDict, Set, Tuple, Type
 
 from flytekit.configuration import SerializationSettings
 from flytekit.core.base_task import PythonTask, TaskMetadata
@@ -18,8 +19,30 @@ from flytekit.models.literals import LiteralMap
 from flytekit.models.security import Secret, SecurityContext
 
 _PRIMARY_CONTAINER_NAME_FIELD = "primary_container_name"
+_INPUT_PLACEHOLDER_REGEX = re.compile(r"^\{\{\s*\.inputs\.(.*?)\s*\}\}$")
 DOCKER_IMPORT_ERROR_MESSAGE = "Docker is not installed. Please install Docker by running `pip install docker`."
 
+_docker_client = None
+# Images already known to be present locally, so repeated executions skip the image lookup round trip. If an image is
+# removed behind our back, containers.run still pulls it on ImageNotFound.
+_local_images: Set[str] = set()
+
+
+def _get_docker_client():
+    """
+    Returns a docker client built from the environment, creating it on first use. The client is shared by every
+    container task executed locally in this process, so the environment parsing and daemon handshake happen once.
+    """
+    global _docker_client
+    if _docker_client is None:
+        try:
+            import docker
+        except ImportError:
+            raise ImportError(DOCKER_IMPORT_ERROR_MESSAGE)
+
+        _docker_client = docker.from_env()
+    return _docker_client
+
 
 class ContainerTask(PythonTask):
     """
@@ -90,6 +113,8 @@ class ContainerTask(PythonTask):
         self._outputs = outputs
         self._md_format = metadata_format
         self._io_strategy = io_strategy
+        self._data_loading_config: Optional[_task_model.DataLoadingConfig] = None
+        self._data_loading_config_dirs: Optional[Tuple[Optional[str], Optional[str]]] = None
         self._resources = ResourceSpec(
             requests=requests if requests else Resources(), limits=limits if limits else Resources()
         )
@@ -104,10 +129,7 @@ class ContainerTask(PythonTask):
         """
         Extract the key from the command using regex.
         """
-        import re
-
-        input_regex = r"^\{\{\s*\.inputs\.(.*?)\s*\}\}$"
-        match = re.match(input_regex, cmd)
+        match = _INPUT_PLACEHOLDER_REGEX.match(cmd)
         if match:
             return match.group(1)
         return None
@@ -165,10 +187,13 @@ class ContainerTask(PythonTask):
         return commands, volume_bindings
 
     def _pull_image_if_not_exists(self, client, image: str):
+        if image in _local_images:
+            return
         try:
             if not client.images.list(filters={"reference": image}):
                 logger.info(f"Pulling image: {image} for container task: {self.name}")
                 client.images.pull(image)
+            _local_images.add(image)
         except Exception as e:
             logger.error(f"Failed to pull image {image}: {str(e)}")
             raise
@@ -216,7 +241,9 @@ class ContainerTask(PythonTask):
         if self._outputs:
             for k, output_type in self._outputs.items():
                 output_path = os.path.join(output_directory, k)
-                if output_type in [FlyteFile, FlyteDirectory]:
+                # Blob outputs (including formatted ones such as FlyteFile["csv"]) are handed over by path, so the
+                # file contents are never loaded into memory here.
+                if isinstance(output_type, type) and issubclass(output_type, (FlyteFile, FlyteDirectory)):
                     output_dict[k] = output_type(path=output_path)
                 else:
                     with open(output_path, "r") as f:
@@ -225,11 +252,6 @@ class ContainerTask(PythonTask):
         return output_dict
 
     def execute(self, **kwargs) -> LiteralMap:
-        try:
-            import docker
-        except ImportError:
-            raise ImportError(DOCKER_IMPORT_ERROR_MESSAGE)
-
         from flytekit.core.type_engine import TypeEngine
 
         ctx = FlyteContext.current_context()
@@ -243,7 +265,7 @@ class ContainerTask(PythonTask):
         commands, volume_bindings = self._prepare_command_and_volumes(cmd_and_args, **kwargs)
         volume_bindings[output_directory] = {"bind": self._output_data_dir, "mode": "rw"}
 
-        client = docker.from_env()
+        client = _get_docker_client()
         self._pull_image_if_not_exists(client, self._image)
 
         container = client.containers.run(
@@ -270,13 +292,19 @@ class ContainerTask(PythonTask):
         return self._get_container(settings)
 
     def _get_data_loading_config(self) -> _task_model.DataLoadingConfig:
-        return _task_model.DataLoadingConfig(
-            input_path=self._input_data_dir,
-            output_path=self._output_data_dir,
-            format=self._md_format.value,
-            enabled=True,
-            io_strategy=self._io_strategy.value if self._io_strategy else None,
-        )
+        # The config only depends on instance state, so it is built once and shared by get_container and get_k8s_pod.
+        # It is rebuilt if the data directories change (execute normalizes them in place).
+        data_dirs = (self._input_data_dir, self._output_data_dir)
+        if self._data_loading_config is None or self._data_loading_config_dirs != data_dirs:
+            self._data_loading_config = _task_model.DataLoadingConfig(
+                input_path=self._input_data_dir,
+                output_path=self._output_data_dir,
+                format=self._md_format.value,
+                enabled=True,
+                io_strategy=self._io_strategy.value if self._io_strategy else None,
+            )
+            self._data_loading_config_dirs = data_dirs
+        return self._data_loading_config
 
     def _get_image(self, settings: SerializationSettings) -> str:
         """Update image spec based on fast registration usage, and return string representing the image"""
@@ -8,12 +8,16 @@ import enum
 import inspect
 import json
 import mimetypes
+import operator
+import os
 import sys
 import textwrap
 import threading
 import typing
+import weakref
 from abc import ABC, abstractmethod
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Dict, List, NamedTuple, Optional, Type, cast
 
@@ -254,10 +258,12 @@ class SimpleTransformer(TypeTransformer[T]):
         self._from_literal_transformer = from_literal_transformer
 
     def get_literal_type(self, t: Optional[Type[T]] = None) -> LiteralType:
-        return LiteralType.from_flyte_idl(self._lt.to_flyte_idl())
+        # Callers treat the returned literal type as read-only (see to_literal_type and _add_tag_to_type), so the
+        # same instance can be shared rather than cloned through protobuf on every call.
+        return self._lt
 
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
-        if type(python_val) != self._type:
+        if type(python_val) is not self._type:
             raise TypeTransformerFailedError(
                 f"Expected value of type {self._type} but got '{python_val}' of type {type(python_val)}"
             )
@@ -273,7 +279,7 @@ class SimpleTransformer(TypeTransformer[T]):
 
         try:  # todo(maximsmol): this is quite ugly and each transformer should really check their Literal
             res = self._from_literal_transformer(lv)
-            if type(res) != self._type:
+            if type(res) is not self._type:
                 raise TypeTransformerFailedError(f"Cannot convert literal {lv} to {self._type}")
             return res
         except AttributeError:
@@ -368,11 +374,14 @@ class DataclassTransformer(TypeTransformer[object]):
         super().__init__("Object-Dataclass-Transformer", object)
         self._encoder: Dict[Type, JSONEncoder] = {}
         self._decoder: Dict[Type, JSONDecoder] = {}
+        # Keyed weakly, so that dataclasses defined at runtime are not kept alive by the transformer
+        self._literal_types: "weakref.WeakKeyDictionary[Type, LiteralType]" = weakref.WeakKeyDictionary()
+        self._type_hints: "weakref.WeakKeyDictionary[Type, Dict[str, Type]]" = weakref.WeakKeyDictionary()
 
     def assert_type(self, expected_type: Type[DataClassJsonMixin], v: T):
         # Skip iterating all attributes in the dataclass if the type of v already matches the expected_type
         expected_type = get_underlying_type(expected_type)
-        if type(v) == expected_type or issubclass(type(v), expected_type):
+        if type(v) is expected_type or issubclass(type(v), expected_type):
             return
 
         # @dataclass
@@ -469,6 +478,12 @@ class DataclassTransformer(TypeTransformer[object]):
             # Drop all annotations and handle only the dataclass type passed in.
             t = args[0]
 
+        # The schema and the per-field literal types only depend on the dataclass itself, so build them once.
+        try:
+            return self._literal_types[t]
+        except KeyError:
+            pass
+
         schema = None
         try:
             from marshmallow_enum import EnumField, LoadDumpOptions
@@ -522,7 +537,9 @@ class DataclassTransformer(TypeTransformer[object]):
 
         ts = TypeStructure(tag="", dataclass_type=literal_type)
 
-        return _type_models.LiteralType(simple=_type_models.SimpleType.STRUCT, metadata=schema, structure=ts)
+        lt = _type_models.LiteralType(simple=_type_models.SimpleType.STRUCT, metadata=schema, structure=ts)
+        self._literal_types[t] = lt
+        return lt
 
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
         if isinstance(python_val, dict):
@@ -649,7 +666,12 @@ class DataclassTransformer(TypeTransformer[object]):
                 return python_type(python_val)
             return python_val
 
-        dataclass_attributes = typing.get_type_hints(python_type)
+        # Resolving the type hints evaluates every annotation of the dataclass, so only do it once per dataclass.
+        try:
+            dataclass_attributes = self._type_hints[python_type]
+        except KeyError:
+            dataclass_attributes = typing.get_type_hints(python_type)
+            self._type_hints[python_type] = dataclass_attributes
         for n, t in dataclass_attributes.items():
             val = python_val.__getattribute__(n)
             python_val.__setattr__(n, self._make_dataclass_serializable(val, t))
@@ -751,13 +773,19 @@ class ProtobufTransformer(TypeTransformer[Message]):
 
     def __init__(self):
         super().__init__("Protobuf-Transformer", Message)
+        self._literal_types: "weakref.WeakKeyDictionary[Type, LiteralType]" = weakref.WeakKeyDictionary()
 
     @staticmethod
     def tag(expected_python_type: Type[T]) -> str:
         return f"{expected_python_type.__module__}.{expected_python_type.__name__}"
 
     def get_literal_type(self, t: Type[T]) -> LiteralType:
-        return LiteralType(simple=SimpleType.STRUCT, metadata={ProtobufTransformer.PB_FIELD_KEY: self.tag(t)})
+        try:
+            return self._literal_types[t]
+        except KeyError:
+            lt = LiteralType(simple=SimpleType.STRUCT, metadata={ProtobufTransformer.PB_FIELD_KEY: self.tag(t)})
+            self._literal_types[t] = lt
+            return lt
 
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
         struct = Struct()
@@ -794,6 +822,7 @@ class EnumTransformer(TypeTransformer[enum.Enum]):
 
     def __init__(self):
         super().__init__(name="DefaultEnumTransformer", t=enum.Enum)
+        self._literal_types: "weakref.WeakKeyDictionary[Type, LiteralType]" = weakref.WeakKeyDictionary()
 
     def get_literal_type(self, t: Type[T]) -> LiteralType:
         if is_annotated(t):
@@ -803,10 +832,17 @@ class EnumTransformer(TypeTransformer[enum.Enum]):
                     parsed."
             )
 
+        try:
+            return self._literal_types[t]
+        except KeyError:
+            pass
+
         values = [v.value for v in t]  # type: ignore
         if not isinstance(values[0], str):
             raise TypeTransformerFailedError("Only EnumTypes with value of string are supported")
-        return LiteralType(enum_type=_core_types.EnumType(values=values))
+        lt = LiteralType(enum_type=_core_types.EnumType(values=values))
+        self._literal_types[t] = lt
+        return lt
 
     def to_literal(
         self, ctx: FlyteContext, python_val: enum.Enum, python_type: Type[T], expected: LiteralType
@@ -872,6 +908,10 @@ class TypeEngine(typing.Generic[T]):
     """
 
     _REGISTRY: typing.Dict[type, TypeTransformer[T]] = {}
+    # Transformers resolved by get_transformer, keyed by the (un-annotated) python type. Resolution is a pure function
+    # of the registry, so this is cleared whenever a transformer is registered. Keys are held weakly so that types
+    # created at runtime (e.g. local dataclasses) are not kept alive by the cache.
+    _RESOLVED_CACHE: "weakref.WeakKeyDictionary[type, TypeTransformer[T]]" = weakref.WeakKeyDictionary()
     _RESTRICTED_TYPES: typing.List[type] = []
     _DATACLASS_TRANSFORMER: TypeTransformer = DataclassTransformer()  # type: ignore
     _ENUM_TRANSFORMER: TypeTransformer = EnumTransformer()  # type: ignore
@@ -889,13 +929,14 @@ class TypeEngine(typing.Generic[T]):
         """
         types = [transformer.python_type, *(additional_types or [])]
         for t in types:
-            if t in cls._REGISTRY:
-                existing = cls._REGISTRY[t]
+            existing = cls._REGISTRY.get(t)
+            if existing is not None:
                 raise ValueError(
                     f"Transformer {existing.name} for type {t} is already registered."
                     f" Cannot override with {transformer.name}"
                 )
             cls._REGISTRY[t] = transformer
+        cls._RESOLVED_CACHE.clear()
 
     @classmethod
     def register_restricted_type(
@@ -910,6 +951,16 @@ class TypeEngine(typing.Generic[T]):
     def register_additional_type(cls, transformer: TypeTransformer, additional_type: Type, override=False):
         if additional_type not in cls._REGISTRY or override:
             cls._REGISTRY[additional_type] = transformer
+            cls._RESOLVED_CACHE.clear()
+
+    @classmethod
+    def _unregister(cls, python_type: Type):
+        """
+        Removes the transformer registered for ``python_type``. This is meant for tests that register a transformer
+        temporarily, and also drops any resolution that was cached for the removed transformer.
+        """
+        del cls._REGISTRY[python_type]
+        cls._RESOLVED_CACHE.clear()
 
     @classmethod
     def get_transformer(cls, python_type: Type) -> TypeTransformer[T]:
@@ -943,8 +994,9 @@ class TypeEngine(typing.Generic[T]):
 
         Step 6:
             Pickle transformer is used
+
+        The result of steps 2 to 6 is cached per python type, so repeated lookups are a single dictionary access.
         """
-        cls.lazy_import_transformers()
         # Step 1
         if is_annotated(python_type):
             args = get_args(python_type)
@@ -954,17 +1006,38 @@ class TypeEngine(typing.Generic[T]):
 
             python_type = args[0]
 
+        try:
+            return cls._RESOLVED_CACHE[python_type]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable types cannot be cached, resolve them every time.
+            return cls._resolve_transformer(python_type)
+
+        transformer = cls._resolve_transformer(python_type)
+        # Classes that set their own __origin__ are built anew on every subscription (e.g. FlyteFile["csv"]), so caching
+        # them would only ever add entries.
+        if not (isinstance(python_type, type) and "__origin__" in vars(python_type)):
+            cls._RESOLVED_CACHE[python_type] = transformer
+        return transformer
+
+    @classmethod
+    def _resolve_transformer(cls, python_type: Type) -> TypeTransformer[T]:
+        """
+        Steps 2 to 6 of get_transformer, for a python type that has already been stripped of its annotations.
+        """
+        cls.lazy_import_transformers()
+
         # Step 2
         # this makes sure that if it's a list/dict of annotated types, we hit the unwrapping code in step 2
         # see test_list_of_annotated in test_structured_dataset.py
-        if (
-            (not hasattr(python_type, "__origin__"))
-            or (
-                hasattr(python_type, "__origin__")
-                and (python_type.__origin__ is not list and python_type.__origin__ is not dict)
-            )
-        ) and python_type in cls._REGISTRY:
-            return cls._REGISTRY[python_type]
+        if (not hasattr(python_type, "__origin__")) or (
+            hasattr(python_type, "__origin__")
+            and (python_type.__origin__ is not list and python_type.__origin__ is not dict)
+        ):
+            transformer = cls._REGISTRY.get(python_type)
+            if transformer is not None:
+                return transformer
 
         # Step 3
         if hasattr(python_type, "__origin__"):
@@ -973,8 +1046,9 @@ class TypeEngine(typing.Generic[T]):
             if is_annotated(python_type):
                 return cls.get_transformer(get_args(python_type)[0])
 
-            if python_type.__origin__ in cls._REGISTRY:
-                return cls._REGISTRY[python_type.__origin__]
+            transformer = cls._REGISTRY.get(python_type.__origin__)
+            if transformer is not None:
+                return transformer
 
             raise ValueError(f"Generic Type {python_type.__origin__} not supported currently in Flytekit.")
 
@@ -987,6 +1061,17 @@ class TypeEngine(typing.Generic[T]):
 
         from flytekit.types.iterator.json_iterator import JSONIterator
 
+        # Most classes inherit from the registered type directly, so walking the MRO is a handful of dict lookups
+        # compared to an issubclass check against every registered type. JSON iterators are excluded since they must
+        # match Iterator[JSON] rather than the vanilla Iterator in their MRO.
+        if inspect.isclass(python_type) and not issubclass(python_type, JSONIterator):
+            for base in python_type.__mro__:
+                transformer = cls._REGISTRY.get(base)
+                if transformer is not None:
+                    return transformer
+
+        # Fall back to the full scan for virtual subclasses (e.g. ABC registrations like os.PathLike) and non-class
+        # types.
         for base_type in cls._REGISTRY.keys():
             if base_type is None:
                 continue  # None is actually one of the keys, but isinstance/issubclass doesn't work on it
@@ -1108,6 +1193,21 @@ class TypeEngine(typing.Generic[T]):
         """
         Converts a python value of a given type and expected ``LiteralType`` into a resolved ``Literal`` value.
         """
+        return cls._to_literal(ctx, python_val, python_type, expected)
+
+    @classmethod
+    def _to_literal(
+        cls,
+        ctx: FlyteContext,
+        python_val: typing.Any,
+        python_type: Type,
+        expected: LiteralType,
+        transformer: Optional[TypeTransformer] = None,
+    ) -> Literal:
+        """
+        Same as ``to_literal``, but lets callers converting many values of the same type (e.g. the elements of a
+        list) pass in the transformer they already resolved.
+        """
         from flytekit.core.promise import Promise, VoidPromise
 
         if isinstance(python_val, Promise):
@@ -1126,7 +1226,8 @@ class TypeEngine(typing.Generic[T]):
             )
         if (python_val is None and python_type != type(None)) and expected and expected.union_type is None:
             raise TypeTransformerFailedError(f"Python value cannot be None, expected {python_type}/{expected}")
-        transformer = cls.get_transformer(python_type)
+        if transformer is None:
+            transformer = cls.get_transformer(python_type)
         if transformer.type_assertions_enabled:
             transformer.assert_type(python_type, python_val)
 
@@ -1155,6 +1256,19 @@ class TypeEngine(typing.Generic[T]):
         """
         Converts a Literal value with an expected python type into a python value.
         """
+        return cls._to_python_value(ctx, lv, expected_python_type)
+
+    @classmethod
+    def _to_python_value(
+        cls,
+        ctx: FlyteContext,
+        lv: Literal,
+        expected_python_type: Type,
+        transformer: Optional[TypeTransformer] = None,
+    ) -> typing.Any:
+        """
+        Same as ``to_python_value``, but accepts an already resolved transformer for ``expected_python_type``.
+        """
         # Initiate the process of loading the offloaded literal if offloaded_metadata is set
         if lv.offloaded_metadata:
             literal_local_file = ctx.file_access.get_random_local_path()
@@ -1163,7 +1277,8 @@ class TypeEngine(typing.Generic[T]):
             input_proto = load_proto_from_file(literals_pb2.Literal, literal_local_file)
             lv = Literal.from_flyte_idl(input_proto)
 
-        transformer = cls.get_transformer(expected_python_type)
+        if transformer is None:
+            transformer = cls.get_transformer(expected_python_type)
         return transformer.to_python_value(ctx, lv, expected_python_type)
 
     @classmethod
@@ -1238,17 +1353,24 @@ class TypeEngine(typing.Generic[T]):
         """
         type_hints = type_hints or {}
         literal_map = {}
+        # Many keys usually share the same type, so compute each literal type once. This is keyed by identity rather
+        # than equality, because typing considers e.g. Union[int, str] and Union[str, int] equal even though the
+        # order of their union variants differs.
+        literal_types: typing.Dict[int, LiteralType] = {}
         for k, v in d.items():
             # The guessed type takes precedence over the type returned by the python runtime. This is needed
             # to account for the type erasure that happens in the case of built-in collection containers, such as
             # `list` and `dict`.
             python_type = type_hints.get(k, type(v))
             try:
+                expected = literal_types.get(id(python_type))
+                if expected is None:
+                    expected = literal_types[id(python_type)] = TypeEngine.to_literal_type(python_type)
                 literal_map[k] = TypeEngine.to_literal(
                     ctx=ctx,
                     python_val=v,
                     python_type=python_type,
-                    expected=TypeEngine.to_literal_type(python_type),
+                    expected=expected,
                 )
             except TypeError:
                 raise user_exceptions.FlyteTypeException(type(v), python_type, received_value=v)
@@ -1303,6 +1425,38 @@ class TypeEngine(typing.Generic[T]):
         raise ValueError(f"No transformers could reverse Flyte literal type {flyte_type}")
 
 
+# Lists shorter than this are converted one element after the other, as handing them to the executor costs more than it
+# saves.
+_MIN_CONCURRENT_IO_ELEMENTS = 4
+_io_executor: Optional[ThreadPoolExecutor] = None
+_io_executor_lock = threading.Lock()
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    """
+    Returns the executor used to transfer the elements of a list concurrently. It is created on first use and shared
+    afterwards, so converting a list doesn't start and join a new set of threads every time.
+    """
+    global _io_executor
+    if _io_executor is None:
+        with _io_executor_lock:
+            if _io_executor is None:
+                _io_executor = ThreadPoolExecutor(
+                    max_workers=(os.cpu_count() or 1) * 4, thread_name_prefix="flytekit-list-io"
+                )
+    return _io_executor
+
+
+def _reset_io_executor():
+    # The threads of the executor don't survive a fork, so a forked process creates its own.
+    global _io_executor
+    _io_executor = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_io_executor)
+
+
 class ListTransformer(TypeTransformer[T]):
     """
     Transformer that handles a univariate typing.List[T]
@@ -1364,7 +1518,7 @@ class ListTransformer(TypeTransformer[T]):
         return False
 
     def to_literal(self, ctx: FlyteContext, python_val: T, python_type: Type[T], expected: LiteralType) -> Literal:
-        if type(python_val) != list:
+        if type(python_val) is not list:
             raise TypeTransformerFailedError("Expected a list")
 
         if ListTransformer.is_batchable(python_type):
@@ -1386,7 +1540,22 @@ class ListTransformer(TypeTransformer[T]):
                 lit_list = []
         else:
             t = self.get_sub_type(python_type)
-            lit_list = [TypeEngine.to_literal(ctx, x, t, expected.collection_type) for x in python_val]  # type: ignore
+            # Resolve the element transformer once instead of once per element.
+            sub_transformer = TypeEngine.get_transformer(t)
+            sub_expected = expected.collection_type
+
+            from flytekit.types.pickle.pickle import FlytePickleTransformer
+
+            if isinstance(sub_transformer, FlytePickleTransformer) and len(python_val) >= _MIN_CONCURRENT_IO_ELEMENTS:
+                # Every pickled element is written to disk and uploaded on its own, which is I/O bound, so upload
+                # them concurrently. map() preserves the order of the elements.
+                lit_list = list(
+                    _get_io_executor().map(
+                        lambda x: TypeEngine._to_literal(ctx, x, t, sub_expected, sub_transformer), python_val
+                    )
+                )
+            else:
+                lit_list = [TypeEngine._to_literal(ctx, x, t, sub_expected, sub_transformer) for x in python_val]  # type: ignore
         return Literal(collection=LiteralCollection(literals=lit_list))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> typing.List[typing.Any]:  # type: ignore
@@ -1410,7 +1579,17 @@ class ListTransformer(TypeTransformer[T]):
             return batch_list
         else:
             st = self.get_sub_type(expected_python_type)
-            return [TypeEngine.to_python_value(ctx, x, st) for x in lits]
+            sub_transformer = TypeEngine.get_transformer(st)
+            if (
+                isinstance(sub_transformer, (TextIOTransformer, BinaryIOTransformer))
+                and len(lits) >= _MIN_CONCURRENT_IO_ELEMENTS
+            ):
+                # Every element is downloaded on its own before it is opened, so fetch them concurrently rather
+                # than one after the other. map() preserves the order of the elements.
+                return list(
+                    _get_io_executor().map(lambda x: TypeEngine._to_python_value(ctx, x, st, sub_transformer), lits)
+                )
+            return [TypeEngine._to_python_value(ctx, x, st, sub_transformer) for x in lits]
 
     def guess_python_type(self, literal_type: LiteralType) -> list:  # type: ignore
         if literal_type.collection_type:
@@ -1430,13 +1609,16 @@ def display_pickle_warning(python_type: str):
 
 
 def _add_tag_to_type(x: LiteralType, tag: str) -> LiteralType:
+    # Transformers may hand out cached literal types, so never mutate the one we were given.
+    x = copy.copy(x)
     x._structure = TypeStructure(tag=tag)
     return x
 
 
 def _type_essence(x: LiteralType) -> LiteralType:
     if x.metadata is not None or x.structure is not None or x.annotation is not None:
-        x = LiteralType.from_flyte_idl(x.to_flyte_idl())
+        # A shallow copy is enough to leave the caller's type untouched, no need for a protobuf round trip.
+        x = copy.copy(x)
         x._metadata = None
         x._structure = None
         x._annotation = None
@@ -1445,17 +1627,20 @@ def _type_essence(x: LiteralType) -> LiteralType:
 
 
 def _are_types_castable(upstream: LiteralType, downstream: LiteralType) -> bool:
-    if upstream.collection_type is not None:
-        if downstream.collection_type is None:
-            return False
-
-        return _are_types_castable(upstream.collection_type, downstream.collection_type)
-
-    if upstream.map_value_type is not None:
-        if downstream.map_value_type is None:
-            return False
+    # Unwrap nested lists and maps iteratively rather than recursing once per level.
+    while upstream.collection_type is not None or upstream.map_value_type is not None:
+        if upstream.collection_type is not None:
+            if downstream.collection_type is None:
+                return False
+            upstream, downstream = upstream.collection_type, downstream.collection_type
+        else:
+            if downstream.map_value_type is None:
+                return False
+            upstream, downstream = upstream.map_value_type, downstream.map_value_type
 
-        return _are_types_castable(upstream.map_value_type, downstream.map_value_type)
+    # Primitive types are the most common case, and two of them can only be cast if they are the same primitive.
+    if upstream.simple is not None and downstream.simple is not None:
+        return upstream.simple == downstream.simple
 
     # TODO: Structured dataset type matching requires that downstream structured datasets
     # are a strict sub-set of the upstream structured dataset.
@@ -1514,17 +1699,33 @@ def _are_types_castable(upstream: LiteralType, downstream: LiteralType) -> bool:
     return False
 
 
+if sys.version_info >= (3, 10):
+    from types import UnionType as _PEP604UnionType
+else:
+    _PEP604UnionType = None
+
+
 def _is_union_type(t):
     """Returns True if t is a Union type."""
 
-    if sys.version_info >= (3, 10):
-        import types
+    return (
+        t is typing.Union
+        or get_origin(t) is typing.Union
+        or _PEP604UnionType is not None
+        and isinstance(t, _PEP604UnionType)
+    )
 
-        UnionType = types.UnionType
-    else:
-        UnionType = None
 
-    return t is typing.Union or get_origin(t) is typing.Union or UnionType and isinstance(t, UnionType)
+def _optional_none_index(variant_types: typing.Tuple) -> Optional[int]:
+    """
+    Returns the position of NoneType if the variants are those of an Optional[T], i.e. exactly one type and None.
+    """
+    if len(variant_types) == 2:
+        if variant_types[0] is type(None):
+            return 0
+        if variant_types[1] is type(None):
+            return 1
+    return None
 
 
 class UnionTransformer(TypeTransformer[T]):
@@ -1585,9 +1786,27 @@ class UnionTransformer(TypeTransformer[T]):
         res = None
         res_type = None
         t = None
-        for i in range(len(get_args(python_type))):
+        variant_types = get_args(python_type)
+        candidates: typing.Iterable[int] = range(len(variant_types))
+        none_index = _optional_none_index(variant_types)
+        if none_index is not None:
+            # Optional[T]: None can only go to the None variant and anything else only to T.
+            candidates = [none_index if python_val is None else 1 - none_index]
+        else:
+            # Simple transformers only accept values of exactly their own type, so if all variants use one (e.g.
+            # Union[int, str]) only the variants of that type need to be tried, rather than letting every other
+            # variant fail with an exception.
+            try:
+                variant_transformers = [TypeEngine.get_transformer(v) for v in variant_types]
+            except ValueError:
+                variant_transformers = []
+            if variant_transformers and all(type(trans) is SimpleTransformer for trans in variant_transformers):
+                candidates = [
+                    i for i, trans in enumerate(variant_transformers) if trans.python_type is type(python_val)
+                ]
+        for i in candidates:
             try:
-                t = get_args(python_type)[i]
+                t = variant_types[i]
                 trans: TypeTransformer[T] = TypeEngine.get_transformer(t)
                 res = trans.to_literal(ctx, python_val, t, expected.union_type.variants[i])
                 res_type = _add_tag_to_type(trans.get_literal_type(t), trans.name)
@@ -1616,12 +1835,18 @@ class UnionTransformer(TypeTransformer[T]):
             if union_type.structure is not None:
                 union_tag = union_type.structure.tag
 
+        variant_types = get_args(expected_python_type)
+        if _optional_none_index(variant_types) is not None:
+            value = lv.scalar.union.value if union_type is not None else lv
+            if value.scalar is not None and value.scalar.none_type is not None:
+                return None
+
         found_res = False
         is_ambiguous = False
         cur_transformer = ""
         res = None
         res_tag = None
-        for v in get_args(expected_python_type):
+        for v in variant_types:
             try:
                 trans: TypeTransformer[T] = TypeEngine.get_transformer(v)
                 if union_tag is not None:
@@ -1703,6 +1928,16 @@ class DictTransformer(TypeTransformer[dict]):
         """
         from flytekit.types.pickle import FlytePickle
 
+        # Building the struct straight from the dictionary avoids a trip through a JSON string. It is stricter than
+        # json.dumps though (e.g. about non-string keys), so anything it rejects goes through the JSON path below,
+        # which also decides whether the value has to be pickled.
+        struct = _struct.Struct()
+        try:
+            struct.update(v)
+            return Literal(scalar=Scalar(generic=struct), metadata={"format": "json"})
+        except (TypeError, ValueError):
+            pass
+
         try:
             return Literal(
                 scalar=Scalar(generic=_json_format.Parse(json.dumps(v), _struct.Struct())),
@@ -1758,7 +1993,7 @@ class DictTransformer(TypeTransformer[dict]):
     def to_literal(
         self, ctx: FlyteContext, python_val: typing.Any, python_type: Type[dict], expected: LiteralType
     ) -> Literal:
-        if type(python_val) != dict:
+        if not isinstance(python_val, dict):
             raise TypeTransformerFailedError("Expected a dict")
 
         allow_pickle = False
@@ -1771,17 +2006,21 @@ class DictTransformer(TypeTransformer[dict]):
             return self.dict_to_generic_literal(ctx, python_val, allow_pickle)
 
         lit_map = {}
-        for k, v in python_val.items():
-            if type(k) != str:
-                raise ValueError("Flyte MapType expects all keys to be strings")
-            # TODO: log a warning for Annotated objects that contain HashMethod
-
+        if python_val:
+            # The value type and its transformer are the same for every entry, so only resolve them once.
             if base_type:
                 _, v_type = get_args(base_type)
             else:
                 _, v_type = self.extract_types_or_metadata(python_type)
+            v_transformer = TypeEngine.get_transformer(v_type)
+            v_expected = expected.map_value_type
+
+        for k, v in python_val.items():
+            if type(k) is not str:
+                raise ValueError("Flyte MapType expects all keys to be strings")
+            # TODO: log a warning for Annotated objects that contain HashMethod
 
-            lit_map[k] = TypeEngine.to_literal(ctx, v, cast(type, v_type), expected.map_value_type)
+            lit_map[k] = TypeEngine._to_literal(ctx, v, cast(type, v_type), v_expected, v_transformer)
         return Literal(map=LiteralMap(literals=lit_map))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[dict]) -> dict:
@@ -1797,8 +2036,10 @@ class DictTransformer(TypeTransformer[dict]):
             if tp[0] != str:
                 raise TypeError("TypeMismatch. Destination dictionary does not accept 'str' key")
             py_map = {}
-            for k, v in lv.map.literals.items():
-                py_map[k] = TypeEngine.to_python_value(ctx, v, cast(Type, tp[1]))
+            if lv.map.literals:
+                v_transformer = TypeEngine.get_transformer(tp[1])
+                for k, v in lv.map.literals.items():
+                    py_map[k] = TypeEngine._to_python_value(ctx, v, cast(Type, tp[1]), v_transformer)
             return py_map
 
         # for empty generic we have to explicitly test for lv.scalar.generic is not None as empty dict
@@ -1807,11 +2048,13 @@ class DictTransformer(TypeTransformer[dict]):
             if lv.metadata and lv.metadata.get("format", None) == "pickle":
                 from flytekit.types.pickle import FlytePickle
 
-                uri = json.loads(_json_format.MessageToJson(lv.scalar.generic)).get("pickle_file")
+                uri = _json_format.MessageToDict(lv.scalar.generic).get("pickle_file")
                 return FlytePickle.from_pickle(uri)
 
             try:
-                return json.loads(_json_format.MessageToJson(lv.scalar.generic))
+                # MessageToDict produces the same values as a MessageToJson/json.loads round trip, without going
+                # through a JSON string.
+                return _json_format.MessageToDict(lv.scalar.generic)
             except TypeError:
                 raise TypeTransformerFailedError(f"Cannot convert from {lv} to {expected_python_type}")
 
@@ -2007,7 +2250,7 @@ def _register_default_type_transformers():
             int,
             _type_models.LiteralType(simple=_type_models.SimpleType.INTEGER),
             lambda x: Literal(scalar=Scalar(primitive=Primitive(integer=x))),
-            lambda x: x.scalar.primitive.integer,
+            operator.attrgetter("scalar.primitive.integer"),
         )
     )
 
@@ -2027,7 +2270,7 @@ def _register_default_type_transformers():
             bool,
             _type_models.LiteralType(simple=_type_models.SimpleType.BOOLEAN),
             lambda x: Literal(scalar=Scalar(primitive=Primitive(boolean=x))),
-            lambda x: x.scalar.primitive.boolean,
+            operator.attrgetter("scalar.primitive.boolean"),
         )
     )
 
@@ -2037,7 +2280,7 @@ def _register_default_type_transformers():
             str,
             _type_models.LiteralType(simple=_type_models.SimpleType.STRING),
             lambda x: Literal(scalar=Scalar(primitive=Primitive(string_value=x))),
-            lambda x: x.scalar.primitive.string_value,
+            operator.attrgetter("scalar.primitive.string_value"),
         )
     )
 
@@ -2047,7 +2290,7 @@ def _register_default_type_transformers():
             datetime.datetime,
             _type_models.LiteralType(simple=_type_models.SimpleType.DATETIME),
             lambda x: Literal(scalar=Scalar(primitive=Primitive(datetime=x))),
-            lambda x: x.scalar.primitive.datetime,
+            operator.attrgetter("scalar.primitive.datetime"),
         )
     )
 
@@ -2057,7 +2300,7 @@ def _register_default_type_transformers():
             datetime.timedelta,
             _type_models.LiteralType(simple=_type_models.SimpleType.DURATION),
             lambda x: Literal(scalar=Scalar(primitive=Primitive(duration=x))),
-            lambda x: x.scalar.primitive.duration,
+            operator.attrgetter("scalar.primitive.duration"),
         )
     )
 
@@ -2079,7 +2322,7 @@ def _register_default_type_transformers():
             type(None),
             _type_models.LiteralType(simple=_type_models.SimpleType.NONE),
             lambda x: Literal(scalar=Scalar(none_type=Void())),
-            lambda x: _check_and_convert_void(x),
+            _check_and_convert_void,
         ),
         [None],
     )
@@ -2181,14 +2424,16 @@ class LiteralsResolver(collections.UserDict):
         return self._literals[key]
 
     def __getitem__(self, key: str):
-        # First check to see if it's even in the literal map.
+        # Return the cached value if it's cached, values are only ever cached for keys in the literal map.
+        try:
+            return self._native_values[key]
+        except KeyError:
+            pass
+
+        # Otherwise check to see if it's even in the literal map.
         if key not in self._literals:
             raise ValueError(f"Key {key} is not in the literal map")
 
-        # Return the cached value if it's cached
-        if key in self._native_values:
-            return self._native_values[key]
-
         return self.get(key)
 
     def get(self, attr: str, as_type: Optional[typing.Type] = None) -> typing.Any:  # type: ignore
@@ -2201,10 +2446,12 @@ class LiteralsResolver(collections.UserDict):
         :param as_type:
         :return: Python native value from the LiteralMap
         """
+        try:
+            return self._native_values[attr]
+        except KeyError:
+            pass
         if attr not in self._literals:
             raise AttributeError(f"Attribute {attr} not found")
-        if attr in self.native_values:
-            return self.native_values[attr]
 
         if as_type is None:
             if attr in self._type_hints:
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -19,6 +20,8 @@ from flytekit.types.file import JSONLFile
 
 openai = lazy_module("openai")
 
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 @dataclass
 class BatchResult(DataClassJSONMixin):
@@ -128,8 +131,10 @@ class UploadJSONLFileExecutor(ShimTaskExecutor[UploadJSONLFileTask]):
             ),
         )
 
-        local_jsonl_file = kwargs["jsonl_in"].download()
-        uploaded_file_obj = client.files.create(file=open(local_jsonl_file, "rb"), purpose="batch")
+        jsonl_in: JSONLFile = kwargs["jsonl_in"]
+        # Stream the file from wherever it lives rather than downloading a local copy and reading that back
+        with jsonl_in.open("rb") as f:
+            uploaded_file_obj = client.files.create(file=(Path(jsonl_in.path).name, f), purpose="batch")
         return uploaded_file_obj.id
 
 
@@ -177,22 +182,32 @@ class DownloadJSONFilesExecutor(ShimTaskExecutor[DownloadJSONFilesTask]):
             ),
         )
 
-        batch_result = BatchResult()
         working_dir = flytekit.current_context().working_directory
 
-        for file_name, file_id in zip(
-            ("output_file", "error_file"),
-            (
-                kwargs["batch_endpoint_result"]["output_file_id"],
-                kwargs["batch_endpoint_result"]["error_file_id"],
-            ),
-        ):
-            if file_id:
-                file_path = str(Path(working_dir, file_name).with_suffix(".jsonl"))
+        def download(file_name: str, file_id: str) -> JSONLFile:
+            file_path = str(Path(working_dir, file_name).with_suffix(".jsonl"))
+
+            with client.files.with_streaming_response.content(file_id) as response:
+                # Write in 1 MiB chunks rather than in whatever size the network happens to deliver
+                response.stream_to_file(file_path, chunk_size=DOWNLOAD_CHUNK_SIZE)
 
-                with client.files.with_streaming_response.content(file_id) as response:
-                    response.stream_to_file(file_path)
+            return JSONLFile(file_path)
 
-                setattr(batch_result, file_name, JSONLFile(file_path))
+        files_to_download = {
+            file_name: file_id
+            for file_name, file_id in zip(
+                ("output_file", "error_file"),
+                (
+                    kwargs["batch_endpoint_result"]["output_file_id"],
+                    kwargs["batch_endpoint_result"]["error_file_id"],
+                ),
+            )
+            if file_id
+        }
+        if not files_to_download:
+            return BatchResult()
 
-        return batch_result
+        # The output and error files are independent downloads, so fetch them at the same time
+        with ThreadPoolExecutor(max_workers=len(files_to_download)) as executor:
+            downloaded = executor.map(download, files_to_download.keys(), files_to_download.values())
+            return BatchResult(**dict(zip(files_to_download.keys(), downloaded)))
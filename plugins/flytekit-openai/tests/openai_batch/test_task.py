@@ -79,6 +79,8 @@ def test_upload_jsonl_files_task(mock_context, mock_file_creation):
 
     jsonl_file_output = upload_jsonl_files_task_obj(jsonl_in=JSONLFile(JSONL_FILE))
     assert jsonl_file_output == "file-abc123"
+    mock_file_creation.assert_called_once()
+    assert mock_file_creation.call_args.kwargs["purpose"] == "batch"
 
 
 @mock.patch("openai.resources.files.FilesWithStreamingResponse")
@@ -139,3 +141,6 @@ def test_download_files_task(mock_path, mock_context, mock_streaming):
     assert dataclasses.is_dataclass(output)
     assert output.output_file is not None
     assert output.error_file is not None
+    requested = {c.args[0] for c in mock_streaming.return_value.content.call_args_list}
+    assert requested == {"file-cvaTdG", "file-HOWS94"}
+    response_mock.stream_to_file.assert_called_with(temp_file_path, chunk_size=1 << 20)
@@ -1,12 +1,20 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
 from flyteidl.core.execution_pb2 import TaskExecution, TaskLog
 
 from flytekit import FlyteContextManager, StructuredDataset, logger
 from flytekit.core.type_engine import TypeEngine
 from flytekit.extend.backend.base_agent import AgentRegistry, AsyncAgentBase, Resource, ResourceMeta
-from flytekit.extend.backend.utils import convert_to_flyte_phase, get_agent_secret
+from flytekit.extend.backend.utils import convert_to_flyte_phase, get_agent_secret, is_terminal_phase
 from flytekit.models.literals import LiteralMap
 from flytekit.models.task import TaskTemplate
 from flytekit.models.types import LiteralType, StructuredDatasetType
@@ -14,6 +22,26 @@ from snowflake import connector as sc
 
 TASK_TYPE = "snowflake"
 SNOWFLAKE_PRIVATE_KEY = "snowflake_private_key"
+# Maximum number of idle connections kept around per (user, account, database, schema, warehouse), and how long an
+# idle connection is kept before it is closed
+MAX_IDLE_CONNECTIONS = 8
+IDLE_CONNECTION_TTL_SECONDS = 300
+
+# Minimum time between two status checks of a query that is still in progress. Queries that have been in progress for
+# a while are checked less often.
+STATUS_CHECK_INTERVAL_SECONDS = 5
+LONG_RUNNING_STATUS_CHECK_INTERVAL_SECONDS = 30
+LONG_RUNNING_QUERY_SECONDS = 60
+# Remembered statuses of queries that haven't been polled for this long are dropped, e.g. because the execution was
+# aborted elsewhere or polling moved to another agent replica.
+STALE_STATUS_SECONDS = 5 * LONG_RUNNING_STATUS_CHECK_INTERVAL_SECONDS
+
+# target -> idle connections to it, with the time each was last used
+_idle_connections: Dict[Tuple[str, str, str, str, str], List[Tuple[sc.SnowflakeConnection, float]]] = {}
+_idle_connections_lock = threading.Lock()
+# query id -> (last phase, time of the first check, time of the last check), for queries that are still in progress.
+# Entries are kept in the order they were last checked, so stale ones are always at the front.
+_in_progress_queries: "OrderedDict[str, Tuple[TaskExecution.Phase, float, float]]" = OrderedDict()
 
 
 @dataclass
@@ -28,13 +56,16 @@ class SnowflakeJobMetadata(ResourceMeta):
 
 
 def get_private_key():
-    from cryptography.hazmat.backends import default_backend
-    from cryptography.hazmat.primitives import serialization
+    return _private_key_bytes(get_agent_secret(SNOWFLAKE_PRIVATE_KEY))
 
-    pk_string = get_agent_secret(SNOWFLAKE_PRIVATE_KEY)
+
+@lru_cache(maxsize=1)
+def _private_key_bytes(pk_string: str) -> bytes:
+    # Parsing the PEM key is comparatively expensive and the secret rarely changes, so the DER bytes are cached. The
+    # cache is keyed on the secret itself, which means a rotated key is picked up on the next call.
     # cryptography needs str to be stripped and converted to bytes
-    pk_string = pk_string.strip().encode()
-    p_key = serialization.load_pem_private_key(pk_string, password=None, backend=default_backend())
+    pk_bytes = pk_string.strip().encode()
+    p_key = serialization.load_pem_private_key(pk_bytes, password=None, backend=default_backend())
 
     pkb = p_key.private_bytes(
         encoding=serialization.Encoding.DER,
@@ -45,17 +76,83 @@ def get_private_key():
     return pkb
 
 
-def get_connection(metadata: SnowflakeJobMetadata) -> sc:
+def _connect(user: str, account: str, database: str, schema: str, warehouse: str) -> sc.SnowflakeConnection:
     return sc.connect(
-        user=metadata.user,
-        account=metadata.account,
+        user=user,
+        account=account,
         private_key=get_private_key(),
-        database=metadata.database,
-        schema=metadata.schema,
-        warehouse=metadata.warehouse,
+        database=database,
+        schema=schema,
+        warehouse=warehouse,
     )
 
 
+@contextmanager
+def pooled_connection(
+    user: str, account: str, database: str, schema: str, warehouse: str
+) -> Iterator[sc.SnowflakeConnection]:
+    """
+    Yields an open connection, reusing an idle one for the same target if there is any, so that polling a query does
+    not go through a new login for every call. The connection is handed back to the pool afterwards. Query-level errors
+    (e.g. a user's query that failed) leave the session usable, but any other error closes the connection.
+
+    Only use this for the agent's own metadata calls (status checks, cancellation). User queries can change session
+    state, so they must not run on a shared session.
+    """
+    key = (user, account, database, schema, warehouse)
+    conn = None
+    with _idle_connections_lock:
+        expired = _pop_expired_connections(time.monotonic())
+        idle = _idle_connections.get(key)
+        while idle and conn is None:
+            conn, _ = idle.pop()
+            if conn.is_closed():
+                conn = None
+    for c in expired:
+        c.close()
+    if conn is None:
+        conn = _connect(*key)
+
+    try:
+        yield conn
+    except sc.ProgrammingError:
+        _release_connection(key, conn)
+        raise
+    except BaseException:
+        conn.close()
+        raise
+
+    _release_connection(key, conn)
+
+
+def _release_connection(key: Tuple[str, str, str, str, str], conn: sc.SnowflakeConnection):
+    if conn.is_closed():
+        return
+    with _idle_connections_lock:
+        idle = _idle_connections.setdefault(key, [])
+        if len(idle) < MAX_IDLE_CONNECTIONS:
+            idle.append((conn, time.monotonic()))
+            return
+    conn.close()
+
+
+def _pop_expired_connections(now: float) -> List[sc.SnowflakeConnection]:
+    """
+    Removes the idle connections that haven't been used for IDLE_CONNECTION_TTL_SECONDS from the pool and returns them.
+    Must be called with the pool lock held.
+    """
+    expired = []
+    for key in list(_idle_connections):
+        idle = _idle_connections[key]
+        expired.extend(conn for conn, last_used in idle if now - last_used >= IDLE_CONNECTION_TTL_SECONDS)
+        fresh = [(conn, last_used) for conn, last_used in idle if now - last_used < IDLE_CONNECTION_TTL_SECONDS]
+        if fresh:
+            _idle_connections[key] = fresh
+        else:
+            del _idle_connections[key]
+    return expired
+
+
 class SnowflakeAgent(AsyncAgentBase):
     name = "Snowflake Agent"
 
@@ -71,17 +168,14 @@ class SnowflakeAgent(AsyncAgentBase):
         params = TypeEngine.literal_map_to_kwargs(ctx, inputs, literal_types=literal_types) if inputs.literals else None
 
         config = task_template.config
-        conn = sc.connect(
-            user=config["user"],
-            account=config["account"],
-            private_key=get_private_key(),
-            database=config["database"],
-            schema=config["schema"],
-            warehouse=config["warehouse"],
-        )
-
-        cs = conn.cursor()
-        cs.execute_async(task_template.sql.statement, params)
+        # The query runs on a session of its own, as it may change session state (e.g. USE, ALTER SESSION or temporary
+        # tables). Closing the session doesn't stop the submitted query.
+        conn = _connect(config["user"], config["account"], config["database"], config["schema"], config["warehouse"])
+        try:
+            cs = conn.cursor()
+            cs.execute_async(task_template.sql.statement, params)
+        finally:
+            conn.close()
 
         return SnowflakeJobMetadata(
             user=config["user"],
@@ -94,20 +188,47 @@ class SnowflakeAgent(AsyncAgentBase):
         )
 
     async def get(self, resource_meta: SnowflakeJobMetadata, **kwargs) -> Resource:
-        conn = get_connection(resource_meta)
-        try:
-            query_status = conn.get_query_status_throw_if_error(resource_meta.query_id)
-        except sc.ProgrammingError as err:
-            logger.error("Failed to get snowflake job status with error:", err.msg)
-            return Resource(phase=TaskExecution.FAILED)
-
         log_link = TaskLog(
             uri=construct_query_link(resource_meta=resource_meta),
             name="Snowflake Query Details",
         )
+
+        # Don't ask Snowflake again if the query was still in progress when it was last checked a moment ago.
+        now = time.monotonic()
+        _drop_stale_statuses(now)
+        last_status = _in_progress_queries.get(resource_meta.query_id)
+        if last_status is not None:
+            last_phase, first_checked, last_checked = last_status
+            if now - first_checked >= LONG_RUNNING_QUERY_SECONDS:
+                interval = LONG_RUNNING_STATUS_CHECK_INTERVAL_SECONDS
+            else:
+                interval = STATUS_CHECK_INTERVAL_SECONDS
+            if now - last_checked < interval:
+                return Resource(phase=last_phase, log_links=[log_link])
+
+        try:
+            with pooled_connection(
+                resource_meta.user,
+                resource_meta.account,
+                resource_meta.database,
+                resource_meta.schema,
+                resource_meta.warehouse,
+            ) as conn:
+                query_status = conn.get_query_status_throw_if_error(resource_meta.query_id)
+        except sc.ProgrammingError as err:
+            _in_progress_queries.pop(resource_meta.query_id, None)
+            logger.error(f"Failed to get snowflake job status with error: {err.msg}")
+            return Resource(phase=TaskExecution.FAILED)
+
         # The snowflake job's state is determined by query status.
         # https://github.com/snowflakedb/snowflake-connector-python/blob/main/src/snowflake/connector/constants.py#L373
         cur_phase = convert_to_flyte_phase(str(query_status.name))
+        if is_terminal_phase(cur_phase):
+            _in_progress_queries.pop(resource_meta.query_id, None)
+        else:
+            first_checked = last_status[1] if last_status is not None else now
+            _in_progress_queries[resource_meta.query_id] = (cur_phase, first_checked, now)
+            _in_progress_queries.move_to_end(resource_meta.query_id)
         res = None
 
         if cur_phase == TaskExecution.SUCCEEDED and resource_meta.has_output:
@@ -125,14 +246,33 @@ class SnowflakeAgent(AsyncAgentBase):
         return Resource(phase=cur_phase, outputs=res, log_links=[log_link])
 
     async def delete(self, resource_meta: SnowflakeJobMetadata, **kwargs):
-        conn = get_connection(resource_meta)
+        _in_progress_queries.pop(resource_meta.query_id, None)
+        # The connector is blocking, so cancel from a worker thread rather than stalling the event loop.
+        await asyncio.get_running_loop().run_in_executor(None, cancel_query, resource_meta)
+
+
+def _drop_stale_statuses(now: float):
+    while _in_progress_queries:
+        query_id, (_, _, last_checked) = next(iter(_in_progress_queries.items()))
+        if now - last_checked < STALE_STATUS_SECONDS:
+            return
+        del _in_progress_queries[query_id]
+
+
+def cancel_query(resource_meta: SnowflakeJobMetadata):
+    with pooled_connection(
+        resource_meta.user,
+        resource_meta.account,
+        resource_meta.database,
+        resource_meta.schema,
+        resource_meta.warehouse,
+    ) as conn:
         cs = conn.cursor()
         try:
             cs.execute(f"SELECT SYSTEM$CANCEL_QUERY('{resource_meta.query_id}')")
             cs.fetchall()
         finally:
             cs.close()
-            conn.close()
 
 
 def construct_query_link(resource_meta: SnowflakeJobMetadata) -> str:
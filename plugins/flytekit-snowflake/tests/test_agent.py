@@ -1,10 +1,11 @@
+import dataclasses
 from datetime import timedelta
 from unittest import mock
 from unittest.mock import MagicMock
 
 import pytest
 from flyteidl.core.execution_pb2 import TaskExecution
-from flytekitplugins.snowflake.agent import SnowflakeJobMetadata
+from flytekitplugins.snowflake.agent import SnowflakeJobMetadata, _idle_connections
 
 import flytekit.models.interface as interface_models
 from flytekit import lazy_module
@@ -26,6 +27,8 @@ async def test_snowflake_agent(mock_get_private_key):
     snowflake_connector.connect = MagicMock()
     mock_conn_instance = snowflake_connector.connect.return_value
     mock_conn_instance.get_query_status_throw_if_error.return_value = query_status_mock
+    mock_conn_instance.is_closed.return_value = False
+    _idle_connections.clear()
 
     mock_cursor = MagicMock()
     mock_cursor.sfqid = "dummy_id"
@@ -109,6 +112,169 @@ async def test_snowflake_agent(mock_get_private_key):
     mock_cursor.execute.assert_called_once_with(f"SELECT SYSTEM$CANCEL_QUERY('{metadata.query_id}')")
     mock_cursor.fetchall.assert_called_once()
 
-    # Verify that the connection was closed
     mock_cursor.close.assert_called_once()
+
+    # The query ran on a connection of its own that was closed, while get and delete shared a pooled one
+    assert snowflake_connector.connect.call_count == 2
     mock_conn_instance.close.assert_called_once()
+    assert [[conn for conn, _ in idle] for idle in _idle_connections.values()] == [[mock_conn_instance]]
+
+
+@mock.patch("flytekitplugins.snowflake.agent.get_private_key", return_value="pb")
+@pytest.mark.asyncio
+async def test_snowflake_agent_reuses_connection_after_query_error(mock_get_private_key):
+    snowflake_connector = lazy_module("snowflake.connector")
+    snowflake_connector.connect = MagicMock()
+    mock_conn_instance = snowflake_connector.connect.return_value
+    mock_conn_instance.is_closed.return_value = False
+    mock_conn_instance.get_query_status_throw_if_error.side_effect = snowflake_connector.ProgrammingError(
+        "SQL compilation error"
+    )
+    _idle_connections.clear()
+
+    agent = AgentRegistry.get_agent("snowflake")
+    metadata = SnowflakeJobMetadata(
+        user="dummy_user",
+        account="dummy_account",
+        database="dummy_database",
+        schema="dummy_schema",
+        warehouse="dummy_warehouse",
+        query_id="failed_id",
+        has_output=False,
+    )
+
+    assert (await agent.get(metadata)).phase == TaskExecution.FAILED
+    assert (await agent.get(metadata)).phase == TaskExecution.FAILED
+
+    # A failed query doesn't make the session unusable, so it is kept in the pool and reused
+    snowflake_connector.connect.assert_called_once()
+    mock_conn_instance.close.assert_not_called()
+    assert [[conn for conn, _ in idle] for idle in _idle_connections.values()] == [[mock_conn_instance]]
+
+
+@mock.patch("flytekitplugins.snowflake.agent.get_private_key", return_value="pb")
+@pytest.mark.asyncio
+async def test_snowflake_agent_closes_expired_idle_connections(mock_get_private_key):
+    from flytekitplugins.snowflake.agent import IDLE_CONNECTION_TTL_SECONDS
+
+    snowflake_connector = lazy_module("snowflake.connector")
+    snowflake_connector.connect = MagicMock()
+    mock_conn_instance = snowflake_connector.connect.return_value
+    mock_conn_instance.is_closed.return_value = False
+    query_status_mock = MagicMock()
+    query_status_mock.name = "SUCCEEDED"
+    mock_conn_instance.get_query_status_throw_if_error.return_value = query_status_mock
+    _idle_connections.clear()
+
+    agent = AgentRegistry.get_agent("snowflake")
+    metadata = SnowflakeJobMetadata(
+        user="dummy_user",
+        account="dummy_account",
+        database="dummy_database",
+        schema="dummy_schema",
+        warehouse="dummy_warehouse",
+        query_id="dummy_id",
+        has_output=False,
+    )
+
+    with mock.patch("flytekitplugins.snowflake.agent.time.monotonic") as monotonic:
+        for now in (0, IDLE_CONNECTION_TTL_SECONDS - 1):
+            monotonic.return_value = now
+            await agent.get(metadata)
+        snowflake_connector.connect.assert_called_once()
+        mock_conn_instance.close.assert_not_called()
+
+        # The connection was idle for too long, so it is closed and a new one is opened
+        monotonic.return_value = 2 * IDLE_CONNECTION_TTL_SECONDS
+        await agent.get(metadata)
+        assert snowflake_connector.connect.call_count == 2
+        mock_conn_instance.close.assert_called_once()
+        assert [[t for _, t in idle] for idle in _idle_connections.values()] == [[2 * IDLE_CONNECTION_TTL_SECONDS]]
+
+
+def test_get_private_key_is_cached():
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+    from flytekitplugins.snowflake.agent import _private_key_bytes, get_private_key
+
+    def pem():
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        return key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption(),
+        ).decode()
+
+    _private_key_bytes.cache_clear()
+    first, rotated = pem(), pem()
+    with mock.patch("flytekitplugins.snowflake.agent.get_agent_secret", return_value=first):
+        pkb = get_private_key()
+        assert get_private_key() is pkb
+    with mock.patch("flytekitplugins.snowflake.agent.get_agent_secret", return_value=rotated):
+        assert get_private_key() != pkb
+    assert _private_key_bytes.cache_info().misses == 2
+
+
+@mock.patch("flytekitplugins.snowflake.agent.get_private_key", return_value="pb")
+@pytest.mark.asyncio
+async def test_snowflake_agent_status_is_cached_while_running(mock_get_private_key):
+    from flytekitplugins.snowflake.agent import STALE_STATUS_SECONDS, _in_progress_queries
+
+    snowflake_connector = lazy_module("snowflake.connector")
+    snowflake_connector.connect = MagicMock()
+    mock_conn_instance = snowflake_connector.connect.return_value
+    mock_conn_instance.is_closed.return_value = False
+    query_status_mock = MagicMock()
+    query_status_mock.name = "RUNNING"
+    mock_conn_instance.get_query_status_throw_if_error.return_value = query_status_mock
+    _idle_connections.clear()
+    _in_progress_queries.clear()
+
+    agent = AgentRegistry.get_agent("snowflake")
+    metadata = SnowflakeJobMetadata(
+        user="dummy_user",
+        account="dummy_account",
+        database="dummy_database",
+        schema="dummy_schema",
+        warehouse="dummy_warehouse",
+        query_id="dummy_id",
+        has_output=False,
+    )
+
+    with mock.patch("flytekitplugins.snowflake.agent.time.monotonic") as monotonic:
+        # Polls shortly after each other reuse the last status
+        for now in (0, 1, 4):
+            monotonic.return_value = now
+            assert (await agent.get(metadata)).phase == TaskExecution.RUNNING
+        assert mock_conn_instance.get_query_status_throw_if_error.call_count == 1
+
+        monotonic.return_value = 5
+        assert (await agent.get(metadata)).phase == TaskExecution.RUNNING
+        assert mock_conn_instance.get_query_status_throw_if_error.call_count == 2
+
+        # Once the query has been running for a while, it is checked less often
+        monotonic.return_value = 70
+        await agent.get(metadata)
+        monotonic.return_value = 90
+        await agent.get(metadata)
+        assert mock_conn_instance.get_query_status_throw_if_error.call_count == 3
+
+        query_status_mock.name = "SUCCEEDED"
+        monotonic.return_value = 100
+        assert (await agent.get(metadata)).phase == TaskExecution.SUCCEEDED
+        assert "dummy_id" not in _in_progress_queries
+
+        # Statuses of queries that stopped being polled here are dropped once they are stale
+        query_status_mock.name = "RUNNING"
+        for query_id, now in (("abandoned_1", 200), ("abandoned_2", 210), ("active", 300)):
+            monotonic.return_value = now
+            await agent.get(dataclasses.replace(metadata, query_id=query_id))
+        assert list(_in_progress_queries) == ["abandoned_1", "abandoned_2", "active"]
+
+        monotonic.return_value = 200 + STALE_STATUS_SECONDS
+        await agent.get(dataclasses.replace(metadata, query_id="active"))
+        assert list(_in_progress_queries) == ["abandoned_2", "active"]
+
+        monotonic.return_value = 300 + STALE_STATUS_SECONDS - 1
+        await agent.get(dataclasses.replace(metadata, query_id="active"))
+        assert list(_in_progress_queries) == ["active"]
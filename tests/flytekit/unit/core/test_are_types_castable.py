@@ -136,3 +136,15 @@ def test_collection_union():
     # not the other way around
     assert not _are_types_castable(LiteralType(collection_type=str_or_int), LiteralType(collection_type=str_type))
     assert not _are_types_castable(LiteralType(collection_type=str_or_int), LiteralType(collection_type=int_type))
+
+
+def test_deeply_nested_containers():
+    upstream, downstream = int_type, str_or_int
+    for i in range(50):
+        if i % 2:
+            upstream, downstream = LiteralType(map_value_type=upstream), LiteralType(map_value_type=downstream)
+        else:
+            upstream, downstream = LiteralType(collection_type=upstream), LiteralType(collection_type=downstream)
+    assert _are_types_castable(upstream, downstream)
+    assert not _are_types_castable(downstream, upstream)
+    assert not _are_types_castable(LiteralType(collection_type=upstream), LiteralType(map_value_type=downstream))
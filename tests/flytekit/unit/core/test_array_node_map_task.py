@@ -6,6 +6,7 @@ from typing import List
 from typing_extensions import Annotated
 import tempfile
 
+import mock
 import pytest
 
 from flytekit import dynamic, map_task, task, workflow
@@ -134,6 +135,19 @@ def test_serialization(serialization_settings):
     ]
 
 
+def test_get_command_reuses_resolver(serialization_settings):
+    @task
+    def t1(a: int) -> int:
+        return a + 1
+
+    arraynode_maptask = map_task(t1)
+    with mock.patch("flytekit.core.array_node_map_task.ArrayNodeMapTaskResolver") as resolver_cls:
+        args = arraynode_maptask.get_command(serialization_settings)
+        assert args == arraynode_maptask.get_command(serialization_settings)
+        resolver_cls.assert_not_called()
+    assert args[args.index("--resolver") + 1] == "flytekit.core.array_node_map_task.ArrayNodeMapTaskResolver"
+
+
 def test_fast_serialization(serialization_settings):
     serialization_settings.fast_serialization_settings = FastSerializationSettings(enabled=True)
 
@@ -176,6 +190,11 @@ def test_fast_serialization(serialization_settings):
     ]
 
 
+@task
+def say_hello(name: str) -> str:
+    return f"hello {name}!"
+
+
 @pytest.mark.parametrize(
     "kwargs1, kwargs2, same",
     [
@@ -207,10 +226,6 @@ def test_fast_serialization(serialization_settings):
     ],
 )
 def test_metadata_in_task_name(kwargs1, kwargs2, same):
-    @task
-    def say_hello(name: str) -> str:
-        return f"hello {name}!"
-
     t1 = map_task(say_hello, **kwargs1)
     t2 = map_task(say_hello, **kwargs2)
 
@@ -272,19 +287,22 @@ def test_inputs_outputs_length():
         _ = map_task(many_outputs)
 
 
-def test_parameter_order():
-    @task()
-    def task1(a: int, b: float, c: str) -> str:
-        return f"{a} - {b} - {c}"
+@task()
+def task1(a: int, b: float, c: str) -> str:
+    return f"{a} - {b} - {c}"
 
-    @task()
-    def task2(b: float, c: str, a: int) -> str:
-        return f"{a} - {b} - {c}"
 
-    @task()
-    def task3(c: str, a: int, b: float) -> str:
-        return f"{a} - {b} - {c}"
+@task()
+def task2(b: float, c: str, a: int) -> str:
+    return f"{a} - {b} - {c}"
+
 
+@task()
+def task3(c: str, a: int, b: float) -> str:
+    return f"{a} - {b} - {c}"
+
+
+def test_parameter_order():
     param_a = [1, 2, 3]
     param_b = [0.1, 0.2, 0.3]
     param_c = "c"
@@ -3,6 +3,7 @@ import sys
 from collections import OrderedDict
 from typing import Tuple
 
+import mock
 import pytest
 from kubernetes.client.models import (
     V1Affinity,
@@ -18,10 +19,12 @@ from kubernetes.client.models import (
 
 from flytekit import kwtypes, task, workflow
 from flytekit.configuration import Image, ImageConfig, SerializationSettings
+from flytekit.core import container_task
 from flytekit.core.container_task import ContainerTask
 from flytekit.core.pod_template import PodTemplate
 from flytekit.image_spec.image_spec import ImageBuildEngine, ImageSpec
 from flytekit.tools.translator import get_serializable_task
+from flytekit.types.file import FlyteFile
 
 
 @pytest.mark.skipif(
@@ -93,6 +96,56 @@ def test_local_execution_special_cases():
     assert td == ct._string_to_timedelta(str(td))
 
 
+@mock.patch("docker.from_env")
+def test_docker_client_is_reused(mock_from_env):
+    with mock.patch.object(container_task, "_docker_client", None):
+        client = container_task._get_docker_client()
+        assert container_task._get_docker_client() is client
+    mock_from_env.assert_called_once()
+
+
+def test_pull_image_only_checked_once():
+    ct = ContainerTask(name="pull-once", image="test-image:v1", command=["echo"])
+    client = mock.MagicMock()
+    client.images.list.return_value = []
+    with mock.patch.object(container_task, "_local_images", set()):
+        ct._pull_image_if_not_exists(client, "test-image:v1")
+        ct._pull_image_if_not_exists(client, "test-image:v1")
+    client.images.list.assert_called_once()
+    client.images.pull.assert_called_once_with("test-image:v1")
+
+
+def test_get_output_dict_passes_blob_paths(tmp_path):
+    ct = ContainerTask(
+        name="blob-outputs",
+        image="test-image",
+        command=["echo"],
+        outputs=kwtypes(csv=FlyteFile["csv"], count=int),
+    )
+    (tmp_path / "csv").write_text("a,b\n1,2\n")
+    (tmp_path / "count").write_text("2")
+
+    outputs = ct._get_output_dict(str(tmp_path))
+    assert outputs["csv"].path == str(tmp_path / "csv")
+    assert outputs["count"] == 2
+
+
+def test_data_loading_config_is_reused():
+    ct = ContainerTask(
+        name="data-loading-config",
+        image="test-image",
+        command=["echo"],
+        input_data_dir="/var/inputs/",
+        output_data_dir="/var/outputs",
+    )
+    config = ct._get_data_loading_config()
+    assert ct._get_data_loading_config() is config
+    assert config.to_flyte_idl().input_path == "/var/inputs/"
+
+    ct._input_data_dir = "/var/inputs"
+    assert ct._get_data_loading_config().to_flyte_idl().input_path == "/var/inputs"
+
+
 def test_pod_template():
     ps = V1PodSpec(
         containers=[], tolerations=[V1Toleration(effect="NoSchedule", key="nvidia.com/gpu", operator="Exists")]
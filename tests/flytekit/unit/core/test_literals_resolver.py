@@ -134,3 +134,17 @@ def test_interface():
     guessed_df = lr.get("my_df")
     # Using the user specified type, so number of columns is correct.
     assert len(guessed_df.metadata.structured_dataset_type.columns) == 2
+
+
+def test_literals_resolver_cache():
+    lr = LiteralsResolver({"a": Literal(scalar=Scalar(primitive=Primitive(integer=1)))})
+    lr.update_type_hints({"a": int})
+
+    assert lr["a"] == 1
+    assert lr.native_values == {"a": 1}
+    assert lr.get("a") == 1
+
+    with pytest.raises(ValueError, match="Key b is not in the literal map"):
+        lr["b"]
+    with pytest.raises(AttributeError, match="Attribute b not found"):
+        lr.get("b")
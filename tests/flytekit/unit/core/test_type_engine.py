@@ -2,10 +2,12 @@ import dataclasses
 import datetime
 import json
 import os
+import pathlib
 import re
 import sys
 import tempfile
 import typing
+from collections import OrderedDict
 from dataclasses import asdict, dataclass, field
 from datetime import timedelta
 from enum import Enum, auto
@@ -115,6 +117,80 @@ def test_type_resolution():
     assert type(TypeEngine.get_transformer(typing.Any)) == FlytePickleTransformer
 
 
+def test_type_resolution_cache():
+    class Foo: ...
+
+    class FooTransformer(SimpleTransformer):
+        def __init__(self):
+            super().__init__(
+                "Foo",
+                Foo,
+                LiteralType(simple=SimpleType.STRING),
+                lambda x: Literal(scalar=Scalar(primitive=Primitive(string_value=""))),
+                lambda x: Foo(),
+            )
+
+    # Unknown types fall back to pickle, and the resolution is reused
+    t = TypeEngine.get_transformer(Foo)
+    assert type(t) == FlytePickleTransformer
+    assert TypeEngine.get_transformer(Foo) is t
+    assert TypeEngine.get_transformer(Annotated[Foo, "bar"]) is t
+
+    # Registering a transformer invalidates earlier resolutions
+    TypeEngine.register(FooTransformer())
+    assert TypeEngine.get_transformer(Foo).name == "Foo"
+
+    # And so does unregistering it
+    TypeEngine._unregister(Foo)
+    assert type(TypeEngine.get_transformer(Foo)) == FlytePickleTransformer
+
+
+def test_type_resolution_cache_does_not_hold_types():
+    import gc
+
+    class Foo: ...
+
+    TypeEngine.get_transformer(Foo)
+    assert Foo in TypeEngine._RESOLVED_CACHE
+    size = len(TypeEngine._RESOLVED_CACHE)
+    del Foo
+    gc.collect()
+    assert len(TypeEngine._RESOLVED_CACHE) == size - 1
+
+    # Parametrized file and directory types are new classes on every subscription, so they are never cached
+    csv_file = FlyteFile["csv"]
+    assert isinstance(TypeEngine.get_transformer(csv_file), FlyteFilePathTransformer)
+    assert csv_file not in TypeEngine._RESOLVED_CACHE
+    assert FlyteDirectory["csv"] not in TypeEngine._RESOLVED_CACHE
+    TypeEngine.get_transformer(FlyteDirectory["csv"])
+    assert len(TypeEngine._RESOLVED_CACHE) == size - 1
+
+
+def test_type_resolution_subclasses():
+    class MyStr(str): ...
+
+    class MyDate(datetime.datetime): ...
+
+    assert TypeEngine.get_transformer(MyStr) is TypeEngine.get_transformer(str)
+    assert TypeEngine.get_transformer(MyDate) is TypeEngine.get_transformer(datetime.datetime)
+    assert type(TypeEngine.get_transformer(FlyteFile["csv"])) == FlyteFilePathTransformer
+    # os.PathLike is not in the MRO of pathlib.Path, it is only registered as a virtual subclass
+    assert type(TypeEngine.get_transformer(pathlib.Path)) == FlyteFilePathTransformer
+
+
+def test_simple_literal_type_is_not_mutated():
+    lt = TypeEngine.to_literal_type(int)
+    assert TypeEngine.to_literal_type(int) is lt
+
+    annotated_lt = TypeEngine.to_literal_type(Annotated[int, FlyteAnnotation({"foo": "bar"})])
+    assert annotated_lt.annotation.annotations == {"foo": "bar"}
+    union_lt = TypeEngine.to_literal_type(typing.Union[int, str])
+    assert union_lt.union_type.variants[0].structure.tag == "int"
+
+    assert lt.annotation is None
+    assert lt.structure is None
+
+
 def test_file_formats_getting_literal_type():
     transformer = TypeEngine.get_transformer(FlyteFile)
 
@@ -622,6 +698,98 @@ def test_list_transformer():
     assert xx == [3, 4]
 
 
+def test_list_transformer_resolves_element_transformer_once():
+    ctx = FlyteContext.current_context()
+    lt = TypeEngine.to_literal_type(typing.List[int])
+
+    with mock.patch.object(TypeEngine, "get_transformer", wraps=TypeEngine.get_transformer) as get_transformer:
+        lit = TypeEngine.to_literal(ctx, list(range(10)), typing.List[int], lt)
+        assert get_transformer.call_count == 2
+        get_transformer.reset_mock()
+
+        assert TypeEngine.to_python_value(ctx, lit, typing.List[int]) == list(range(10))
+        assert get_transformer.call_count == 2
+
+
+def test_list_of_text_io(tmp_path):
+    ctx = FlyteContext.current_context()
+    metadata = BlobMetadata(type=BlobType(format="", dimensionality=BlobType.BlobDimensionality.SINGLE))
+    lits = []
+    for i in range(5):
+        p = tmp_path / f"{i}.txt"
+        p.write_text(f"file {i}")
+        lits.append(Literal(scalar=Scalar(blob=Blob(metadata=metadata, uri=str(p)))))
+    lv = Literal(collection=LiteralCollection(literals=lits))
+    files = TypeEngine.to_python_value(ctx, lv, typing.List[typing.TextIO])
+    try:
+        assert [f.read() for f in files] == [f"file {i}" for i in range(5)]
+    finally:
+        for f in files:
+            f.close()
+
+    # Short lists are downloaded one after the other
+    short_lv = Literal(collection=LiteralCollection(literals=lits[:2]))
+    with mock.patch("flytekit.core.type_engine._get_io_executor", side_effect=AssertionError("should not be used")):
+        files = TypeEngine.to_python_value(ctx, short_lv, typing.List[typing.TextIO])
+    try:
+        assert [f.read() for f in files] == ["file 0", "file 1"]
+    finally:
+        for f in files:
+            f.close()
+
+
+def test_dict_transformer_resolves_value_transformer_once():
+    ctx = FlyteContext.current_context()
+    pt = typing.Dict[str, int]
+    lt = TypeEngine.to_literal_type(pt)
+    python_val = {str(i): i for i in range(10)}
+
+    with mock.patch.object(TypeEngine, "get_transformer", wraps=TypeEngine.get_transformer) as get_transformer:
+        lit = TypeEngine.to_literal(ctx, python_val, pt, lt)
+        assert get_transformer.call_count == 2
+        get_transformer.reset_mock()
+
+        assert TypeEngine.to_python_value(ctx, lit, pt) == python_val
+        assert get_transformer.call_count == 2
+
+    empty = TypeEngine.to_literal(ctx, {}, pt, lt)
+    assert empty.map.literals == {}
+    with mock.patch.object(TypeEngine, "get_transformer", wraps=TypeEngine.get_transformer) as get_transformer:
+        assert TypeEngine.to_python_value(ctx, empty, pt) == {}
+        assert get_transformer.call_count == 1
+
+
+def test_dict_to_generic_literal():
+    ctx = FlyteContext.current_context()
+    python_val = {"a": 1, "b": [1.5, "x", None, True, {"c": "d"}]}
+    lit = DictTransformer.dict_to_generic_literal(ctx, python_val, allow_pickle=False)
+    assert lit.metadata == {"format": "json"}
+    assert TypeEngine.to_python_value(ctx, lit, dict) == python_val
+
+    # Non-string keys are not accepted by Struct.update, but json.dumps converts them to strings
+    lit = DictTransformer.dict_to_generic_literal(ctx, {1: "a"}, allow_pickle=False)
+    assert TypeEngine.to_python_value(ctx, lit, dict) == {"1": "a"}
+
+    class Foo: ...
+
+    with pytest.raises(TypeError):
+        DictTransformer.dict_to_generic_literal(ctx, {"a": Foo()}, allow_pickle=False)
+    lit = DictTransformer.dict_to_generic_literal(ctx, {"a": Foo()}, allow_pickle=True)
+    assert lit.metadata == {"format": "pickle"}
+
+
+def test_dict_transformer_accepts_dict_subclasses():
+    ctx = FlyteContext.current_context()
+    pt = typing.Dict[str, int]
+    lt = TypeEngine.to_literal_type(pt)
+
+    lit = TypeEngine.to_literal(ctx, OrderedDict(a=1, b=2), pt, lt)
+    assert TypeEngine.to_python_value(ctx, lit, pt) == {"a": 1, "b": 2}
+
+    with pytest.raises(ValueError, match="Flyte MapType expects all keys to be strings"):
+        TypeEngine.to_literal(ctx, {1: 1}, pt, lt)
+
+
 def test_protos():
     ctx = FlyteContext.current_context()
 
@@ -629,6 +797,10 @@ def test_protos():
     lt = TypeEngine.to_literal_type(errors_pb2.ContainerError)
     assert lt.simple == SimpleType.STRUCT
     assert lt.metadata["pb_type"] == "flyteidl.core.errors_pb2.ContainerError"
+    assert TypeEngine.to_literal_type(errors_pb2.ContainerError) is lt
+    assert TypeEngine.to_literal_type(errors_pb2.ErrorDocument).metadata["pb_type"] == (
+        "flyteidl.core.errors_pb2.ErrorDocument"
+    )
 
     lit = TypeEngine.to_literal(ctx, pb, errors_pb2.ContainerError, lt)
     new_python_val = TypeEngine.to_python_value(ctx, lit, errors_pb2.ContainerError)
@@ -1465,6 +1637,7 @@ def test_enum_type():
     assert t.enum_type is not None
     assert t.enum_type.values
     assert t.enum_type.values == [c.value for c in Color]
+    assert TypeEngine.to_literal_type(Color) is t
 
     g = TypeEngine.guess_python_type(t)
     assert [e.value for e in g] == [e.value for e in Color]
@@ -1796,6 +1969,49 @@ def test_union_type_simple():
     assert lv.scalar.union.stored_type.structure.dataclass_type is None
 
 
+def test_union_type_simple_only_tries_matching_variant():
+    pt = typing.Optional[int]
+    lt = TypeEngine.to_literal_type(pt)
+    ctx = FlyteContextManager.current_context()
+
+    none_transformer = TypeEngine.get_transformer(type(None))
+    with mock.patch.object(none_transformer, "to_literal", wraps=none_transformer.to_literal) as to_literal:
+        lv = TypeEngine.to_literal(ctx, 3, pt, lt)
+        assert lv.scalar.union.stored_type.structure.tag == "int"
+        to_literal.assert_not_called()
+
+        lv = TypeEngine.to_literal(ctx, None, pt, lt)
+        assert lv.scalar.union.stored_type.structure.tag == "none"
+        to_literal.assert_called_once()
+
+    with pytest.raises(TypeTransformerFailedError, match="Cannot convert from"):
+        TypeEngine.get_transformer(pt).to_literal(ctx, 3.0, pt, lt)
+
+
+def test_optional_type_only_tries_one_variant():
+    pt = typing.Optional[typing.List[int]]
+    lt = TypeEngine.to_literal_type(pt)
+    ctx = FlyteContextManager.current_context()
+
+    list_transformer = TypeEngine.get_transformer(typing.List[int])
+    with mock.patch.object(list_transformer, "to_literal", wraps=list_transformer.to_literal) as to_literal:
+        lv = TypeEngine.to_literal(ctx, None, pt, lt)
+        assert lv.scalar.union.stored_type.structure.tag == "none"
+        to_literal.assert_not_called()
+
+        lv = TypeEngine.to_literal(ctx, [1, 2], pt, lt)
+        assert lv.scalar.union.stored_type.structure.tag == list_transformer.name
+        to_literal.assert_called_once()
+
+    with mock.patch.object(list_transformer, "to_python_value") as to_python_value:
+        none_lv = TypeEngine.to_literal(ctx, None, pt, lt)
+        assert TypeEngine.to_python_value(ctx, none_lv, pt) is None
+        assert TypeEngine.to_python_value(ctx, Literal(scalar=Scalar(none_type=Void())), pt) is None
+        to_python_value.assert_not_called()
+
+    assert TypeEngine.to_python_value(ctx, lv, pt) == [1, 2]
+
+
 def test_union_containers():
     pt = typing.Union[typing.List[typing.Dict[str, typing.List[int]]], typing.Dict[str, typing.List[int]], int]
     lt = TypeEngine.to_literal_type(pt)
@@ -1930,7 +2146,7 @@ def test_union_custom_transformer():
     except TypeError as e:
         assert "Ambiguous choice of variant" in str(e)
 
-    del TypeEngine._REGISTRY[MyInt]
+    TypeEngine._unregister(MyInt)
 
 
 def test_union_custom_transformer_sanity_check():
@@ -1984,7 +2200,7 @@ def test_union_custom_transformer_sanity_check():
     with pytest.raises(TypeError, match="Ambiguous choice of variant for union type"):
         TypeEngine.to_literal(ctx, 3, pt, lt)
 
-    del TypeEngine._REGISTRY[UnsignedInt]
+    TypeEngine._unregister(UnsignedInt)
 
 
 def test_union_of_lists():
@@ -2228,6 +2444,28 @@ def test_dict_to_literal_map_with_wrong_input_type():
         TypeEngine.dict_to_literal_map(ctx, input, guessed_python_types)
 
 
+def test_dict_to_literal_map_shared_types():
+    ctx = FlyteContext.current_context()
+    python_types = {
+        "a": typing.List[int],
+        "b": typing.List[int],
+        "c": typing.Union[int, str],
+        "d": typing.Union[str, int],
+    }
+    python_value = {"a": [1], "b": [2], "c": "x", "d": "y"}
+
+    with mock.patch.object(TypeEngine, "to_literal_type", wraps=TypeEngine.to_literal_type) as to_literal_type:
+        lm = TypeEngine.dict_to_literal_map(ctx, python_value, python_types)
+        requested = [c.args[0] for c in to_literal_type.call_args_list]
+        # The List[int] hint is shared by "a" and "b", the two unions are distinct objects despite comparing equal
+        assert requested.count(typing.List[int]) == 1
+        assert requested.count(typing.Union[int, str]) == 2
+
+    assert lm.literals["b"].collection.literals[0].scalar.primitive.integer == 2
+    assert lm.literals["c"].scalar.union.stored_type.structure.tag == "str"
+    assert lm.literals["d"].scalar.union.stored_type.structure.tag == "str"
+
+
 def test_nested_annotated():
     """
     Test to show that nested Annotated types are flattened.
@@ -3176,6 +3414,56 @@ def test_dataclass_encoder_and_decoder_registry():
     assert transformer._decoder.get(Datum)
 
 
+def test_dataclass_literal_type_is_cached():
+    @dataclass
+    class Datum:
+        x: int
+        y: str
+
+    transformer = TypeEngine.get_transformer(Datum)
+    lt = TypeEngine.to_literal_type(Datum)
+    assert TypeEngine.to_literal_type(Datum) is lt
+    assert TypeEngine.to_literal_type(Annotated[Datum, "foo"]) is lt
+    assert transformer._literal_types.get(Datum) is lt
+
+    # Tagging the union variant must not leak into the cached dataclass literal type
+    union_lt = TypeEngine.to_literal_type(typing.Union[Datum, int])
+    assert union_lt.union_type.variants[0].structure.tag == transformer.name
+    assert lt.structure.tag == ""
+    assert lt.structure.dataclass_type["x"] == TypeEngine.to_literal_type(int)
+
+    ctx = FlyteContext.current_context()
+    TypeEngine.to_literal(ctx, Datum(x=1, y="a"), Datum, lt)
+    with mock.patch("typing.get_type_hints", side_effect=AssertionError("type hints should be cached")):
+        lv = TypeEngine.to_literal(ctx, Datum(x=2, y="b"), Datum, lt)
+    assert TypeEngine.to_python_value(ctx, lv, Datum) == Datum(x=2, y="b")
+
+
+def test_literal_type_caches_do_not_hold_types():
+    import gc
+
+    @dataclass
+    class Sample:
+        x: int
+
+    class Shade(Enum):
+        LIGHT = "light"
+        DARK = "dark"
+
+    dataclass_transformer, enum_transformer = TypeEngine.get_transformer(Sample), TypeEngine.get_transformer(Shade)
+    TypeEngine.to_literal_type(Sample)
+    dataclass_transformer._make_dataclass_serializable(Sample(x=1), Sample)
+    TypeEngine.to_literal_type(Shade)
+    assert Sample in dataclass_transformer._literal_types and Sample in dataclass_transformer._type_hints
+    assert Shade in enum_transformer._literal_types
+
+    del Sample, Shade
+    gc.collect()
+    assert not any(t.__name__ == "Sample" for t in dataclass_transformer._literal_types.keys())
+    assert not any(t.__name__ == "Sample" for t in dataclass_transformer._type_hints.keys())
+    assert not any(t.__name__ == "Shade" for t in enum_transformer._literal_types.keys())
+
+
 def test_ListTransformer_get_sub_type():
     assert ListTransformer.get_sub_type_or_none(typing.List[str]) is str
 
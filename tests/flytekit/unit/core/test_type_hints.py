@@ -1836,7 +1836,7 @@ def test_union_type_ambiguity_checking():
     ):
         assert wf(a=10) == 10
 
-    del TypeEngine._REGISTRY[MyInt]
+    TypeEngine._unregister(MyInt)
 
 
 def test_union_type_ambiguity_resolution():
@@ -1880,7 +1880,7 @@ def test_union_type_ambiguity_resolution():
     assert wf(a=10) == "10"
     assert wf(a=-10) == "MyInt -10"
 
-    del TypeEngine._REGISTRY[MyInt]
+    TypeEngine._unregister(MyInt)
 
 
 def test_task_annotate_primitive_type_is_allowed():
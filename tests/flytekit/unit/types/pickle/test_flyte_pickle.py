@@ -3,14 +3,16 @@ from collections import OrderedDict
 from collections.abc import Sequence
 from typing import Any, Dict, List, Union, Tuple
 
+import mock
 import numpy as np
 import pytest
 from typing_extensions import Annotated
 
 import flytekit.configuration
 from flytekit.configuration import Image, ImageConfig
-from flytekit.core import context_manager
+from flytekit.core import context_manager, type_engine
 from flytekit.core.task import task
+from flytekit.core.type_engine import TypeEngine
 from flytekit.core.workflow import workflow
 from flytekit.models.core.types import BlobType
 from flytekit.models.literals import BlobMetadata
@@ -96,6 +98,30 @@ def test_nested2():
     )
 
 
+def test_list_of_pickles():
+    class Foo(object):
+        def __init__(self, number: int):
+            self.number = number
+
+    ctx = context_manager.FlyteContext.current_context()
+    python_val = [Foo(number=i) for i in range(20)]
+    lt = TypeEngine.to_literal_type(List[Foo])
+
+    lv = TypeEngine.to_literal(ctx, python_val, List[Foo], lt)
+    assert len({lit.scalar.blob.uri for lit in lv.collection.literals}) == 20
+
+    pv = TypeEngine.to_python_value(ctx, lv, List[Foo])
+    assert [foo.number for foo in pv] == list(range(20))
+
+    # The executor is shared between conversions, and short lists don't use it at all
+    executor = type_engine._get_io_executor()
+    TypeEngine.to_literal(ctx, python_val, List[Foo], lt)
+    assert type_engine._get_io_executor() is executor
+    with mock.patch("flytekit.core.type_engine._get_io_executor", side_effect=AssertionError("should not be used")):
+        lv = TypeEngine.to_literal(ctx, python_val[:2], List[Foo], lt)
+    assert [foo.number for foo in TypeEngine.to_python_value(ctx, lv, List[Foo])] == [0, 1]
+
+
 @pytest.mark.skipif("pandas" not in sys.modules, reason="Pandas is not installed.")
 def test_union():
     import pandas as pd